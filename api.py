@@ -1,6 +1,6 @@
 from services import PromptService
 from models import Prompt
-from typing import List, Optional
+from typing import List, Optional, Iterator, Tuple
 
 class PromptManagerAPI:
     """
@@ -8,8 +8,8 @@ class PromptManagerAPI:
     Provides a simplified interface for the console application to interact
     with the PromptService.
     """
-    def __init__(self):
-        self.service = PromptService()
+    def __init__(self, use_cache: bool = False):
+        self.service = PromptService(use_cache=use_cache)
 
     def add_new_prompt(self, text: str, tags: List[str], tool: str) -> Optional[int]:
         """
@@ -18,6 +18,20 @@ class PromptManagerAPI:
         """
         return self.service.add_prompt(text, tags, tool)
 
+    def add_new_prompts(self, prompts: List[Prompt]) -> List[int]:
+        """
+        API method to add many prompts at once.
+        Delegates to the PromptService.
+        """
+        return self.service.add_prompts(prompts)
+
+    def bulk_import_api(self, prompts: List[Prompt]) -> bool:
+        """
+        API method to import prompts with known IDs, overwriting existing ones.
+        Delegates to the PromptService.
+        """
+        return self.service.import_prompts(prompts)
+
     def get_prompt_details(self, prompt_id: int) -> Optional[Prompt]:
         """
         API method to get prompt details by ID.
@@ -46,6 +60,20 @@ class PromptManagerAPI:
         """
         return self.service.list_all_prompts()
 
+    def get_page_api(self, after_id: int = 0, limit: int = 50) -> List[Prompt]:
+        """
+        API method to get one page of prompts ordered by ID.
+        Delegates to the PromptService.
+        """
+        return self.service.list_page(after_id, limit)
+
+    def iter_all_prompts_api(self) -> Iterator[Prompt]:
+        """
+        API method to lazily iterate over all prompts.
+        Delegates to the PromptService.
+        """
+        return self.service.iter_all_prompts()
+
     def search_and_filter_prompts_api(self, keyword: Optional[str] = None, is_favorite: Optional[bool] = None) -> List[Prompt]:
         """
         API method to search and filter prompts.
@@ -53,6 +81,14 @@ class PromptManagerAPI:
         """
         return self.service.search_and_filter_prompts(keyword, is_favorite)
 
+    def search_page_api(self, keyword: Optional[str] = None, offset: int = 0, limit: int = 50,
+                        is_favorite: Optional[bool] = None) -> Tuple[List[Prompt], int]:
+        """
+        API method to get one page of search results and the total number of matches.
+        Delegates to the PromptService.
+        """
+        return self.service.search_page(keyword, offset, limit, is_favorite)
+
     def toggle_favorite_api(self, prompt_id: int) -> Optional[bool]:
         """
         API method to toggle favorite status.
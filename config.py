@@ -1,32 +1,42 @@
 import os
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+_dotenv_loaded = False
+
+def _env(key: str):
+    """
+    Reads a variable from the real environment (e.g. exported by a container, CI job or shell profile).
+    The .env file is only parsed, once, when a variable is missing from it.
+    """
+    global _dotenv_loaded
+    if key not in os.environ and not _dotenv_loaded:
+        load_dotenv() # Load environment variables from .env file
+        _dotenv_loaded = True
+    return os.getenv(key)
 
 class Config:
     """
     Configuration class to hold database credentials.
-    These are loaded from the .env file.
+    These are loaded from the environment, falling back to the .env file.
     """
-    DB_HOST = os.getenv('DB_HOST')
-    DB_USER = os.getenv('DB_USER')
-    DB_PASSWORD = os.getenv('DB_PASSWORD')
-    DB_NAME = os.getenv('DB_NAME')
+    DB_HOST = _env('DB_HOST')
+    DB_USER = _env('DB_USER')
+    DB_PASSWORD = _env('DB_PASSWORD')
+    DB_NAME = _env('DB_NAME')
 
 class Messages:
     """
     Messages class to hold all user-facing strings.
-    These are loaded from the .env file for easy customization.
+    These are loaded from the environment or the .env file for easy customization.
     """
-    WELCOME = os.getenv('MSG_WELCOME')
-    MENU = os.getenv('MSG_MENU')
-    PROMPT_ADDED = os.getenv('MSG_PROMPT_ADDED')
-    PROMPT_NOT_FOUND = os.getenv('MSG_PROMPT_NOT_FOUND')
-    PROMPT_UPDATED = os.getenv('MSG_PROMPT_UPDATED')
-    PROMPT_DELETED = os.getenv('MSG_PROMPT_DELETED')
-    NO_PROMPTS = os.getenv('MSG_NO_PROMPTS')
-    SEARCH_PROMPT = os.getenv('MSG_SEARCH_PROMPT')
-    FAVORITE_TOGGLED = os.getenv('MSG_FAVORITE_TOGGLED')
-    INVALID_CHOICE = os.getenv('MSG_INVALID_CHOICE')
-    EXIT = os.getenv('MSG_EXIT')
+    WELCOME = _env('MSG_WELCOME')
+    MENU = _env('MSG_MENU')
+    PROMPT_ADDED = _env('MSG_PROMPT_ADDED')
+    PROMPT_NOT_FOUND = _env('MSG_PROMPT_NOT_FOUND')
+    PROMPT_UPDATED = _env('MSG_PROMPT_UPDATED')
+    PROMPT_DELETED = _env('MSG_PROMPT_DELETED')
+    NO_PROMPTS = _env('MSG_NO_PROMPTS')
+    SEARCH_PROMPT = _env('MSG_SEARCH_PROMPT')
+    FAVORITE_TOGGLED = _env('MSG_FAVORITE_TOGGLED')
+    INVALID_CHOICE = _env('MSG_INVALID_CHOICE')
+    EXIT = _env('MSG_EXIT')
@@ -1,31 +1,107 @@
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import replace
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector.constants import ClientFlag
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool
 from config import Config
 from models import Prompt
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+
+POOL_NAME = "prompts"
+# The pool opens every connection up front, and each PromptDB keeps the one it borrows until close().
+# A process normally has a single live PromptDB (one console session), so one pooled connection is
+# enough; PromptDB instances beyond POOL_SIZE get a dedicated connection instead (see PromptDB.connect).
+POOL_SIZE = 1
+
+# Shared connection pool, created on first use so importing this module never touches the network
+_POOL: Optional[MySQLConnectionPool] = None
+
+def connection_config() -> Dict[str, Any]:
+    """
+    Returns the connection settings shared by pooled and dedicated connections.
+    """
+    return dict(
+        host=Config.DB_HOST,
+        user=Config.DB_USER,
+        password=Config.DB_PASSWORD,
+        database=Config.DB_NAME,
+        autocommit=True, # Reads need no COMMIT; writes open explicit transactions
+        connection_timeout=5,
+        use_pure=False, # Prefer the C extension's protocol parser when it is installed
+        client_flags=[ClientFlag.FOUND_ROWS] # rowcount counts matched rows, even if unchanged
+    )
+
+def get_pool() -> MySQLConnectionPool:
+    """
+    Returns the module-level connection pool, creating it on first call.
+    Raises mysql.connector.Error if the pool cannot be created.
+    """
+    global _POOL
+    if _POOL is None:
+        if not mysql.connector.HAVE_CEXT:
+            # Rows are then decoded by the pure-Python protocol parser, which dominates large result sets
+            print("MySQL C extension not available; falling back to the slower pure-Python driver.")
+        _POOL = MySQLConnectionPool(
+            pool_name=POOL_NAME,
+            pool_size=POOL_SIZE,
+            pool_reset_session=False, # Skip the session reset round-trip when connections are reused
+            **connection_config()
+        )
+    return _POOL
 
 class PromptDB:
     """
     Manages database operations for the Prompt Manager application.
     Acts as the Data Access Object (DAO) layer.
     """
-    def __init__(self):
+    BATCH_SIZE = 1000 # Rows per multi-row INSERT statement
+    # Secondary indexes on 'prompts', matching the predicates the DAO queries use
+    PROMPT_INDEXES = (
+        ("idx_fav", "INDEX idx_fav (is_favorite)"),
+        ("idx_tool", "INDEX idx_tool (tool)"),
+        ("ft_text_tool", "FULLTEXT KEY ft_text_tool (text, tool)"),
+    )
+    # InnoDB full-text defaults: innodb_ft_min_token_size and the built-in stopword list
+    FULLTEXT_MIN_TOKEN = 3
+    FULLTEXT_STOPWORDS = frozenset((
+        "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en", "for", "from", "how",
+        "i", "in", "is", "it", "la", "of", "on", "or", "that", "the", "this", "to", "was", "what",
+        "when", "where", "who", "will", "with", "und", "www",
+    ))
+    IDLE_PING_SECONDS = 60 # Ping the server before a query once the connection has idled this long
+
+    def __init__(self, use_cache: bool = False):
+        """
+        Args:
+            use_cache (bool): Keep an in-process cache of prompts read by ID and of the full listing.
+                Writes made through this instance invalidate it, but writes from other processes
+                do not, so only enable it when this process is the only writer.
+        """
         self.connection = None
+        self.use_cache = use_cache
+        self._cache: Dict[int, Prompt] = {}
+        self._all_cache: Optional[List[Prompt]] = None
+        self._last_used = time.monotonic()
+        self._in_tx = False # True inside transaction(); DAO methods then leave committing to it
+        self._tx_failed = False
         self.connect()
         self.create_table() # Ensure the prompts table exists on initialization
 
     def connect(self):
         """
-        Establishes a connection to the MySQL database using credentials from Config.
+        Borrows a connection to the MySQL database from the shared pool, or opens a dedicated
+        one if every pooled connection is already held by another PromptDB.
         Handles connection errors.
         """
         try:
-            self.connection = mysql.connector.connect(
-                host=Config.DB_HOST,
-                user=Config.DB_USER,
-                password=Config.DB_PASSWORD,
-                database=Config.DB_NAME
-            )
+            try:
+                self.connection = get_pool().get_connection()
+            except PoolError:
+                self.connection = mysql.connector.connect(**connection_config())
             if self.connection.is_connected():
                 print("Successfully connected to MySQL database.")
         except Error as e:
@@ -34,15 +110,31 @@ class PromptDB:
 
     def close(self):
         """
-        Closes the database connection if it's open.
+        Returns the database connection to the pool, or disconnects a dedicated one.
+        The pool does not reset sessions, so an open transaction is rolled back and any unread
+        result consumed first. The connection is released even if its server session has died,
+        otherwise its pool slot would never be returned.
         """
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
-            print("MySQL connection closed.")
+        if not self.connection:
+            return
+        try:
+            if self.connection.unread_result:
+                self.connection.consume_results()
+            if self._in_tx or self.connection.in_transaction:
+                self.connection.rollback()
+        except Error as e:
+            print(f"Error cleaning up MySQL connection: {e}")
+        self._in_tx = False
+        try:
+            self.connection.close() # Pooled connections go back to the pool; dedicated ones disconnect
+        except Error as e:
+            print(f"Error closing MySQL connection: {e}")
+        self.connection = None
+        print("MySQL connection closed.")
 
     def create_table(self):
         """
-        Creates the 'prompts' table in the database if it does not already exist.
+        Creates the 'prompts' and 'prompt_tags' tables in the database if they do not already exist.
         This ensures the schema is ready when the application starts.
         """
         if not self.connection:
@@ -57,9 +149,26 @@ class PromptDB:
                     text TEXT NOT NULL,
                     tags VARCHAR(255) DEFAULT '',
                     tool VARCHAR(255) DEFAULT '',
-                    is_favorite BOOLEAN DEFAULT FALSE
+                    is_favorite BOOLEAN DEFAULT FALSE,
+                    INDEX idx_fav (is_favorite),
+                    INDEX idx_tool (tool),
+                    FULLTEXT KEY ft_text_tool (text, tool)
                 )
             """)
+            # Tables created before an index was introduced need it added explicitly
+            for index_name, definition in self.PROMPT_INDEXES:
+                self._ensure_index(cursor, "prompts", index_name, definition)
+            # One row per (prompt, tag) so tag searches are indexed lookups instead of LIKE scans
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS prompt_tags (
+                    prompt_id INT NOT NULL,
+                    tag VARCHAR(255) NOT NULL,
+                    PRIMARY KEY (prompt_id, tag),
+                    INDEX idx_tag (tag),
+                    FOREIGN KEY (prompt_id) REFERENCES prompts(id) ON DELETE CASCADE
+                )
+            """)
+            self._backfill_tags(cursor)
             self.connection.commit()
             print("Table 'prompts' checked/created successfully.")
         except Error as e:
@@ -67,6 +176,180 @@ class PromptDB:
         finally:
             cursor.close()
 
+    def _ensure_index(self, cursor, table: str, index_name: str, definition: str):
+        """
+        Adds an index to an existing table unless information_schema shows it is already present.
+        MySQL has no ADD INDEX IF NOT EXISTS, so the catalog is probed first.
+        """
+        cursor.execute("""
+            SELECT 1 FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+            LIMIT 1
+        """, (table, index_name))
+        if not cursor.fetchall():
+            cursor.execute(f"ALTER TABLE {table} ADD {definition}")
+
+    @classmethod
+    def _fulltext_query(cls, keyword: str) -> str:
+        """
+        Turns free-form user input into a BOOLEAN MODE full-text query.
+        Every indexable word is required and prefix-matched. Stopwords and words shorter than
+        FULLTEXT_MIN_TOKEN are left out because InnoDB never indexes them, so requiring them
+        would make the query unmatchable. Operator characters are dropped so user input
+        cannot produce a syntax error.
+        """
+        words = [word for word in re.findall(r"\w+", keyword.lower())
+                 if len(word) >= cls.FULLTEXT_MIN_TOKEN and word not in cls.FULLTEXT_STOPWORDS]
+        return " ".join(f"+{word}*" for word in words)
+
+    @staticmethod
+    def _escape_like(keyword: str) -> str:
+        """
+        Escapes LIKE wildcards in user input so they match literally.
+        """
+        return keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @staticmethod
+    def _clean_tags(tags: List[str]) -> List[str]:
+        """
+        Strips whitespace from tags and drops empty ones, the same way tags are read back.
+        """
+        return [tag.strip() for tag in tags if tag.strip()]
+
+    def _backfill_tags(self, cursor):
+        """
+        Populates 'prompt_tags' from the comma-separated 'tags' column when the side table is empty,
+        so databases created before the side table existed remain searchable by tag.
+        """
+        cursor.execute("SELECT 1 FROM prompt_tags LIMIT 1")
+        if cursor.fetchall():
+            return
+        cursor.execute("SELECT id, tags FROM prompts WHERE tags <> ''")
+        rows = cursor.fetchall()
+        self._save_tags(cursor, [(prompt_id, tag) for prompt_id, tags in rows
+                                 for tag in self._clean_tags(tags.split(','))])
+
+    def _save_tags(self, cursor, rows: List[tuple]):
+        """
+        Inserts (prompt_id, tag) pairs into 'prompt_tags' using the caller's cursor and transaction.
+        Duplicate tags on the same prompt are ignored; any other failure (e.g. a missing prompt) raises.
+        """
+        if rows:
+            cursor.executemany(
+                "INSERT INTO prompt_tags (prompt_id, tag) VALUES (%s, %s) ON DUPLICATE KEY UPDATE tag = tag", rows)
+
+    def _keepalive(self):
+        """
+        Checks the connection before a query if it has been idle for IDLE_PING_SECONDS,
+        reconnecting (3 attempts, 1 second apart) if the server dropped it, e.g. after wait_timeout.
+        Busy connections skip the ping entirely, so the check only costs a round-trip after a pause.
+        Inside transaction() a dropped connection is never replaced: the server has already rolled back
+        the transaction's earlier writes, so the transaction is marked failed and Error is raised instead
+        of letting later writes autocommit on a fresh session.
+        """
+        now = time.monotonic()
+        if now - self._last_used > self.IDLE_PING_SECONDS:
+            try:
+                self.connection.ping()
+            except Error:
+                if self._in_tx:
+                    self._tx_failed = True
+                    raise Error(msg="Connection lost inside a transaction; its earlier writes were rolled back.")
+                try:
+                    self.connection.reconnect(attempts=3, delay=1)
+                except Error as e:
+                    print(f"Error reconnecting to MySQL database: {e}")
+        self._last_used = now
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups several DAO calls into one transaction that is committed once on exit,
+        instead of each call committing (and flushing to disk) on its own:
+
+            with db.transaction():
+                db.update_prompt(a)
+                db.update_prompt(b)
+
+        Rolls back if the block raises or any DAO call inside it failed, and in every rolled-back case
+        raises (the block's own exception, or mysql.connector.Error), so callers never mistake a
+        rollback for a commit. Nested use joins the outer transaction.
+        """
+        if self._in_tx:
+            yield
+            return
+        if not self.connection:
+            raise Error(msg="Cannot start transaction: No database connection.")
+        self._keepalive()
+        self.connection.start_transaction()
+        self._in_tx = True
+        self._tx_failed = False
+        try:
+            yield
+        except BaseException:
+            self._abort_transaction()
+            raise
+        if self._tx_failed:
+            self._abort_transaction()
+            raise Error(msg="Transaction rolled back: an operation inside it failed.")
+        self._in_tx = False
+        try:
+            self.connection.commit()
+        except Error:
+            self._abort_transaction()
+            raise
+
+    def _abort_transaction(self):
+        """
+        Rolls back the transaction opened by transaction() and drops any cached rows read inside it.
+        """
+        self._in_tx = False
+        try:
+            self.connection.rollback()
+        except Error as e:
+            print(f"Error rolling back transaction: {e}")
+        # Reads inside the transaction may have cached rows that no longer exist
+        self._cache.clear()
+        self._invalidate()
+
+    def _begin(self):
+        """
+        Starts a transaction for a single DAO call, unless one is already open via transaction().
+        """
+        if not self._in_tx:
+            self.connection.start_transaction()
+
+    def _commit(self):
+        """
+        Commits a single DAO call's transaction; inside transaction() the commit is deferred to its end.
+        """
+        if not self._in_tx:
+            self.connection.commit()
+
+    def _rollback(self):
+        """
+        Rolls back a failed DAO call; inside transaction() the whole transaction is marked to roll back.
+        """
+        if self._in_tx:
+            self._tx_failed = True
+        else:
+            self.connection.rollback()
+
+    def _invalidate(self, prompt_id: Optional[int] = None):
+        """
+        Drops cached data made stale by a write: the full listing, and the given prompt if any.
+        """
+        self._all_cache = None
+        if prompt_id is not None:
+            self._cache.pop(prompt_id, None)
+
+    @staticmethod
+    def _copy(prompt: Prompt) -> Prompt:
+        """
+        Returns a copy of a cached prompt so callers can modify it without corrupting the cache.
+        """
+        return replace(prompt, tags=list(prompt.tags))
+
     def insert_prompt(self, prompt: Prompt) -> Optional[int]:
         """
         Inserts a new prompt record into the 'prompts' table.
@@ -77,37 +360,139 @@ class PromptDB:
             return None
 
         sql = "INSERT INTO prompts (text, tags, tool, is_favorite) VALUES (%s, %s, %s, %s)"
+        tags = self._clean_tags(prompt.tags)
         # Convert tags list to a comma-separated string for storage
-        values = (prompt.text, ",".join(prompt.tags), prompt.tool, prompt.is_favorite)
+        values = (prompt.text, ",".join(tags), prompt.tool, prompt.is_favorite)
+        self._keepalive()
         cursor = self.connection.cursor()
         try:
+            self._begin() # The prompt row and its tag rows commit together
             cursor.execute(sql, values)
-            self.connection.commit()
-            return cursor.lastrowid # Returns the ID of the last inserted row
+            prompt_id = cursor.lastrowid # The ID of the last inserted row
+            self._save_tags(cursor, [(prompt_id, tag) for tag in tags])
+            self._commit()
+            self._invalidate()
+            return prompt_id
         except Error as e:
             print(f"Error inserting prompt: {e}")
-            self.connection.rollback() # Rollback changes on error
+            self._rollback() # Rollback changes on error
             return None
         finally:
             cursor.close()
 
+    def insert_prompts(self, prompts: List[Prompt]) -> List[int]:
+        """
+        Inserts many prompt records using multi-row INSERT statements.
+        Rows are sent in chunks of BATCH_SIZE to stay under max_allowed_packet,
+        and the whole batch is committed once at the end.
+        Returns the IDs of the inserted prompts, or an empty list on failure.
+        """
+        if not self.connection:
+            print("Cannot insert prompts: No database connection.")
+            return []
+        if not prompts:
+            return []
+
+        self._keepalive()
+        cursor = self.connection.cursor()
+        try:
+            # Multi-primary setups space generated IDs by auto_increment_increment instead of 1
+            cursor.execute("SELECT @@auto_increment_increment")
+            (step,) = cursor.fetchone()
+            self._begin()
+            ids = []
+            for start in range(0, len(prompts), self.BATCH_SIZE):
+                chunk = prompts[start:start + self.BATCH_SIZE]
+                tags = [self._clean_tags(prompt.tags) for prompt in chunk]
+                placeholders = ", ".join(["(%s, %s, %s, %s)"] * len(chunk))
+                sql = f"INSERT INTO prompts (text, tags, tool, is_favorite) VALUES {placeholders}"
+                values = [value for prompt, prompt_tags in zip(chunk, tags)
+                          for value in (prompt.text, ",".join(prompt_tags), prompt.tool, prompt.is_favorite)]
+                cursor.execute(sql, values)
+                # A multi-row INSERT reports the first generated ID; InnoDB allocates the rest
+                # as one block, spaced by auto_increment_increment
+                chunk_ids = range(cursor.lastrowid, cursor.lastrowid + len(chunk) * step, step)
+                self._save_tags(cursor, [(prompt_id, tag) for prompt_id, prompt_tags in zip(chunk_ids, tags)
+                                         for tag in prompt_tags])
+                ids.extend(chunk_ids)
+            self._commit()
+            self._invalidate()
+            return ids
+        except Error as e:
+            print(f"Error inserting prompts: {e}")
+            self._rollback()
+            return []
+        finally:
+            cursor.close()
+
+    def upsert_prompts(self, prompts: List[Prompt]) -> bool:
+        """
+        Inserts or overwrites many prompt records by ID using multi-row
+        INSERT ... ON DUPLICATE KEY UPDATE statements, so re-importing the same data creates no duplicates.
+        Rows are sent in chunks of BATCH_SIZE and the whole import is committed once at the end.
+        Every prompt must have an ID. Returns True on success, False otherwise.
+        """
+        if not self.connection:
+            print("Cannot import prompts: No database connection.")
+            return False
+        if any(prompt.id is None for prompt in prompts):
+            print("Cannot import prompts: Every prompt needs an ID.")
+            return False
+        if not prompts:
+            return True
+
+        self._keepalive()
+        cursor = self.connection.cursor()
+        try:
+            self._begin()
+            for start in range(0, len(prompts), self.BATCH_SIZE):
+                chunk = prompts[start:start + self.BATCH_SIZE]
+                tags = [self._clean_tags(prompt.tags) for prompt in chunk]
+                placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * len(chunk))
+                sql = (f"INSERT INTO prompts (id, text, tags, tool, is_favorite) VALUES {placeholders} "
+                       "ON DUPLICATE KEY UPDATE text = VALUES(text), tags = VALUES(tags), "
+                       "tool = VALUES(tool), is_favorite = VALUES(is_favorite)")
+                values = [value for prompt, prompt_tags in zip(chunk, tags)
+                          for value in (prompt.id, prompt.text, ",".join(prompt_tags), prompt.tool, prompt.is_favorite)]
+                cursor.execute(sql, values)
+                # Replace the tag rows of every imported prompt
+                ids = [prompt.id for prompt in chunk]
+                cursor.execute(f"DELETE FROM prompt_tags WHERE prompt_id IN ({', '.join(['%s'] * len(ids))})", ids)
+                self._save_tags(cursor, [(prompt.id, tag) for prompt, prompt_tags in zip(chunk, tags)
+                                         for tag in prompt_tags])
+            self._commit()
+            self._cache.clear()
+            self._invalidate()
+            return True
+        except Error as e:
+            print(f"Error importing prompts: {e}")
+            self._rollback()
+            return False
+        finally:
+            cursor.close()
+
     def get_prompt_by_id(self, prompt_id: int) -> Optional[Prompt]:
         """
         Retrieves a single prompt record by its ID.
         Returns a Prompt object or None if not found.
         """
+        if self.use_cache and prompt_id in self._cache:
+            return self._copy(self._cache[prompt_id])
         if not self.connection:
             print("Cannot retrieve prompt: No database connection.")
             return None
 
         sql = "SELECT id, text, tags, tool, is_favorite FROM prompts WHERE id = %s"
-        # Use dictionary=True to fetch rows as dictionaries, making it easier to convert to Prompt object
-        cursor = self.connection.cursor(dictionary=True)
+        self._keepalive()
+        cursor = self.connection.cursor()
         try:
             cursor.execute(sql, (prompt_id,))
             record = cursor.fetchone()
             if record:
-                return Prompt.from_dict(record)
+                prompt = Prompt._from_row(*record)
+                if self.use_cache:
+                    self._cache[prompt_id] = self._copy(prompt)
+                return prompt
             return None
         except Error as e:
             print(f"Error retrieving prompt: {e}")
@@ -129,19 +514,57 @@ class PromptDB:
             return False
 
         sql = "UPDATE prompts SET text = %s, tags = %s, tool = %s, is_favorite = %s WHERE id = %s"
-        values = (prompt.text, ",".join(prompt.tags), prompt.tool, prompt.is_favorite, prompt.id)
+        tags = self._clean_tags(prompt.tags)
+        values = (prompt.text, ",".join(tags), prompt.tool, prompt.is_favorite, prompt.id)
+        self._keepalive()
         cursor = self.connection.cursor()
         try:
+            self._begin()
             cursor.execute(sql, values)
-            self.connection.commit()
-            return cursor.rowcount > 0 # Returns True if at least one row was affected
+            updated = cursor.rowcount > 0 # True if the prompt exists (FOUND_ROWS counts matched rows)
+            if updated:
+                cursor.execute("DELETE FROM prompt_tags WHERE prompt_id = %s", (prompt.id,))
+                self._save_tags(cursor, [(prompt.id, tag) for tag in tags])
+            self._commit()
+            self._invalidate(prompt.id)
+            return updated
         except Error as e:
             print(f"Error updating prompt: {e}")
-            self.connection.rollback()
+            self._rollback()
             return False
         finally:
             cursor.close()
 
+    def toggle_favorite(self, prompt_id: int) -> Optional[bool]:
+        """
+        Flips the favorite flag of a prompt with a single UPDATE and reads back the new value
+        in the same transaction.
+        Returns the new favorite status, or None if the prompt does not exist or on failure.
+        """
+        if not self.connection:
+            print("Cannot toggle favorite: No database connection.")
+            return None
+
+        self._keepalive()
+        cursor = self.connection.cursor()
+        try:
+            self._begin() # Holds the row lock until the new value has been read back
+            cursor.execute("UPDATE prompts SET is_favorite = NOT is_favorite WHERE id = %s", (prompt_id,))
+            if cursor.rowcount == 0:
+                self._commit() # Nothing changed; just end the transaction
+                return None
+            cursor.execute("SELECT is_favorite FROM prompts WHERE id = %s", (prompt_id,))
+            (is_favorite,) = cursor.fetchone()
+            self._commit()
+            self._invalidate(prompt_id)
+            return bool(is_favorite)
+        except Error as e:
+            print(f"Error toggling favorite: {e}")
+            self._rollback()
+            return None
+        finally:
+            cursor.close()
+
     def delete_prompt(self, prompt_id: int) -> bool:
         """
         Deletes a prompt record from the 'prompts' table by its ID.
@@ -152,62 +575,203 @@ class PromptDB:
             return False
 
         sql = "DELETE FROM prompts WHERE id = %s"
+        self._keepalive()
         cursor = self.connection.cursor()
         try:
+            # A single autocommitted statement; ON DELETE CASCADE removes the tag rows atomically with it
             cursor.execute(sql, (prompt_id,))
-            self.connection.commit()
+            self._invalidate(prompt_id)
             return cursor.rowcount > 0 # Returns True if a row was deleted
         except Error as e:
             print(f"Error deleting prompt: {e}")
-            self.connection.rollback()
+            self._rollback()
             return False
         finally:
             cursor.close()
 
+    def _stream_all_prompts(self, batch_size: int) -> Iterator[Prompt]:
+        """
+        Yields every prompt, fetching rows from an unbuffered cursor batch_size at a time.
+        Database errors are raised to the caller.
+        """
+        sql = "SELECT id, text, tags, tool, is_favorite FROM prompts"
+        self._keepalive()
+        cursor = self.connection.cursor(buffered=False)
+        try:
+            cursor.execute(sql)
+            while True:
+                records = cursor.fetchmany(batch_size)
+                if not records:
+                    break
+                yield from (Prompt._from_row(*row) for row in records)
+        finally:
+            # Discard rows left behind if the caller stopped early, so the connection is usable again
+            if self.connection.unread_result:
+                self.connection.consume_results()
+            cursor.close()
+
+    def iter_all_prompts(self, batch_size: int = BATCH_SIZE) -> Iterator[Prompt]:
+        """
+        Lazily retrieves all prompt records from the 'prompts' table, batch_size rows at a time,
+        so callers can start using results before the whole table has been read.
+        The connection cannot run other queries until the iteration finishes or is closed.
+        Yields Prompt objects.
+        """
+        if not self.connection:
+            print("Cannot retrieve all prompts: No database connection.")
+            return
+        try:
+            yield from self._stream_all_prompts(batch_size)
+        except Error as e:
+            print(f"Error retrieving all prompts: {e}")
+
     def get_all_prompts(self) -> List[Prompt]:
         """
         Retrieves all prompt records from the 'prompts' table.
         Returns a list of Prompt objects.
         """
+        if self.use_cache and self._all_cache is not None:
+            return [self._copy(prompt) for prompt in self._all_cache]
         if not self.connection:
             print("Cannot retrieve all prompts: No database connection.")
             return []
 
-        sql = "SELECT id, text, tags, tool, is_favorite FROM prompts"
-        cursor = self.connection.cursor(dictionary=True)
         try:
-            cursor.execute(sql)
-            records = cursor.fetchall()
-            return [Prompt.from_dict(record) for record in records]
+            prompts = list(self._stream_all_prompts(self.BATCH_SIZE))
         except Error as e:
             print(f"Error retrieving all prompts: {e}")
             return []
+        if self.use_cache:
+            self._all_cache = [self._copy(prompt) for prompt in prompts]
+        return prompts
+
+    def list_page(self, after_id: int = 0, limit: int = 50) -> List[Prompt]:
+        """
+        Retrieves up to 'limit' prompts whose ID is greater than 'after_id', ordered by ID.
+        Keyset pagination walks the primary key index, so every page costs the same
+        no matter how deep into the table it is; pass the last ID of one page to get the next.
+        Returns a list of Prompt objects (empty once the end of the table is reached).
+        """
+        if not self.connection:
+            print("Cannot retrieve prompts: No database connection.")
+            return []
+
+        sql = "SELECT id, text, tags, tool, is_favorite FROM prompts WHERE id > %s ORDER BY id LIMIT %s"
+        self._keepalive()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql, (after_id, limit))
+            return [Prompt._from_row(*row) for row in cursor.fetchall()]
+        except Error as e:
+            print(f"Error retrieving prompts: {e}")
+            return []
         finally:
             cursor.close()
 
-    def search_prompts(self, keyword: str) -> List[Prompt]:
+    def list_prompts(self, is_favorite: Optional[bool] = None) -> List[Prompt]:
+        """
+        Retrieves all prompts, optionally restricted to a favorite status.
+        The filter is applied in SQL so only matching rows are transferred.
+        Returns a list of Prompt objects.
         """
-        Searches for prompts where the keyword appears in the 'text', 'tags', or 'tool' fields.
-        Uses SQL LIKE for partial matching.
+        return self.search_prompts(None, is_favorite)
+
+    def _search_source(self, keyword: Optional[str], is_favorite: Optional[bool]) -> Tuple[str, List[Any]]:
+        """
+        Builds the FROM/WHERE part and parameters shared by the search queries; select columns as 'prompts.<col>'.
+        A keyword is matched by a UNION of separate branches, each a top-level condition on its own index:
+        the full-text index 'ft_text_tool', a prefix LIKE on 'idx_tool', and an equality lookup on
+        'prompt_tags.idx_tag'. The matching IDs are then joined back to 'prompts' on the primary key.
+        (OR-ing these conditions in a single WHERE would force a full scan: MySQL only uses a full-text
+        index for a top-level MATCH, and index merge does not cover FULLTEXT.)
+        """
+        sql = "FROM prompts"
+        params: List[Any] = []
+        keyword = keyword.strip() if keyword else ""
+        if keyword:
+            escaped = self._escape_like(keyword)
+            fulltext_query = self._fulltext_query(keyword)
+            if fulltext_query:
+                text_branch = "SELECT id FROM prompts WHERE MATCH(text, tool) AGAINST (%s IN BOOLEAN MODE)"
+                params.append(fulltext_query)
+            else:
+                # Only short words or stopwords (e.g. "AI", "go"), none of which are in the
+                # full-text index, so this branch falls back to a substring scan of the text
+                text_branch = "SELECT id FROM prompts WHERE text LIKE %s"
+                params.append(f"%{escaped}%")
+            # Tool names such as "DALL-E" may be made of unindexed tokens, so also match the tool by prefix
+            sql += f"""
+                JOIN ({text_branch}
+                      UNION SELECT id FROM prompts WHERE tool LIKE %s
+                      UNION SELECT prompt_id FROM prompt_tags WHERE tag = %s) AS matches
+                ON matches.id = prompts.id"""
+            params.extend([escaped + "%", keyword])
+        sql += " WHERE 1=1"
+        if is_favorite is not None:
+            sql += " AND prompts.is_favorite = %s"
+            params.append(is_favorite)
+        return sql, params
+
+    def search_prompts(self, keyword: Optional[str], is_favorite: Optional[bool] = None) -> List[Prompt]:
+        """
+        Searches for prompts whose 'text' or 'tool' fields contain words starting with the keyword's indexable words,
+        whose 'tool' starts with the keyword, or where the keyword exactly matches one of the prompt's tags,
+        optionally restricted to a favorite status.
+        Each kind of match is looked up through its own index (see _search_source); a falsy keyword
+        matches every prompt.
         Returns a list of matching Prompt objects.
         """
         if not self.connection:
             print("Cannot search prompts: No database connection.")
             return []
 
-        sql = """
-            SELECT id, text, tags, tool, is_favorite
-            FROM prompts
-            WHERE text LIKE %s OR tags LIKE %s OR tool LIKE %s
-        """
-        search_term = f"%{keyword}%" # Add wildcards for partial matching
-        cursor = self.connection.cursor(dictionary=True)
+        source, params = self._search_source(keyword, is_favorite)
+        sql = "SELECT prompts.id, prompts.text, prompts.tags, prompts.tool, prompts.is_favorite " + source
+
+        self._keepalive()
+        cursor = self.connection.cursor()
         try:
-            cursor.execute(sql, (search_term, search_term, search_term))
-            records = cursor.fetchall()
-            return [Prompt.from_dict(record) for record in records]
+            cursor.execute(sql, tuple(params))
+            return [Prompt._from_row(*row) for row in cursor.fetchall()]
         except Error as e:
             print(f"Error searching prompts: {e}")
             return []
         finally:
             cursor.close()
+
+    def search_prompts_paged(self, keyword: Optional[str], offset: int = 0, limit: int = 50,
+                             is_favorite: Optional[bool] = None) -> Tuple[List[Prompt], int]:
+        """
+        Returns one page of search_prompts results, ordered by ID, together with the total number of matches.
+        The total comes from a COUNT(*) OVER() window on the same query, so a "showing X of Y" screen
+        needs a single round-trip instead of a separate COUNT query. An offset past the last match or a
+        limit of 0 yields no rows to carry the window count, so only then is a separate COUNT(*) issued.
+        COUNT(*) OVER() needs MySQL 8.0 or MariaDB 10.2; older servers reject the query.
+        Returns a tuple of (list of Prompt objects, total matches).
+        """
+        if not self.connection:
+            print("Cannot search prompts: No database connection.")
+            return [], 0
+
+        source, params = self._search_source(keyword, is_favorite)
+        sql = ("SELECT prompts.id, prompts.text, prompts.tags, prompts.tool, prompts.is_favorite, "
+               "COUNT(*) OVER() AS total " + source + " ORDER BY prompts.id LIMIT %s OFFSET %s")
+
+        self._keepalive()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(sql, tuple(params + [limit, offset]))
+            rows = cursor.fetchall()
+            if rows:
+                total = rows[0][-1]
+            elif offset > 0 or limit == 0:
+                cursor.execute("SELECT COUNT(*) " + source, tuple(params))
+                (total,) = cursor.fetchone()
+            else:
+                total = 0
+            return [Prompt._from_row(*row[:-1]) for row in rows], total
+        except Error as e:
+            print(f"Error searching prompts: {e}")
+            return [], 0
+        finally:
+            cursor.close()
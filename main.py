@@ -8,27 +8,44 @@ class ConsoleApp:
     The main console-driven application for the AI Prompt Manager.
     Provides a user interface to interact with the PromptManagerAPI.
     """
+    PAGE_SIZE = 50 # Prompts shown per page in 'View All Prompts'
+
     def __init__(self):
         self.api = PromptManagerAPI()
+        if os.name == 'nt':
+            os.system('') # Enables ANSI escape code processing in the Windows console
 
     def clear_screen(self):
         """
         Clears the console screen for better readability.
-        Works on both Windows ('cls') and Unix-like systems ('clear').
+        Writes ANSI escape codes directly instead of spawning 'cls'/'clear' on every repaint.
+        """
+        sys.stdout.write("\x1b[2J\x1b[H") # Clear the screen and move the cursor to the top-left
+        sys.stdout.flush()
+
+    def format_prompt(self, prompt) -> str:
         """
-        os.system('cls' if os.name == 'nt' else 'clear')
+        Helper method to format the details of a single prompt for display.
+        """
+        fav_status = "Yes" if prompt.is_favorite else "No"
+        return (f"ID: {prompt.id}\n"
+                f"Text: {prompt.text}\n"
+                f"Tags: {', '.join(prompt.tags)}\n"
+                f"Tool: {prompt.tool}\n"
+                f"Favorite: {fav_status}\n"
+                f"{'-' * 30}\n") # Separator for readability
 
     def display_prompt(self, prompt):
         """
         Helper method to display the details of a single prompt in a formatted way.
         """
-        fav_status = "Yes" if prompt.is_favorite else "No"
-        print(f"ID: {prompt.id}")
-        print(f"Text: {prompt.text}")
-        print(f"Tags: {', '.join(prompt.tags)}")
-        print(f"Tool: {prompt.tool}")
-        print(f"Favorite: {fav_status}")
-        print("-" * 30) # Separator for readability
+        sys.stdout.write(self.format_prompt(prompt))
+
+    def display_prompts(self, prompts):
+        """
+        Displays several prompts with a single write to the console instead of one per line.
+        """
+        sys.stdout.write("".join(map(self.format_prompt, prompts)))
 
     def add_prompt(self):
         """
@@ -53,16 +70,20 @@ class ConsoleApp:
     def view_all_prompts(self):
         """
         Handles the 'View All Prompts' functionality.
-        Retrieves all prompts and displays them.
+        Retrieves prompts one page at a time and displays them.
         """
         self.clear_screen()
         print("\n--- All Prompts ---")
-        prompts = self.api.get_all_prompts_api()
+        prompts = self.api.get_page_api(0, self.PAGE_SIZE)
         if not prompts:
             print(Messages.NO_PROMPTS)
-        else:
-            for prompt in prompts:
-                self.display_prompt(prompt)
+        while prompts:
+            self.display_prompts(prompts)
+            if len(prompts) < self.PAGE_SIZE:
+                break # Last page
+            if input("\nPress Enter for the next page, or 'q' to quit: ").lower().strip() == 'q':
+                return
+            prompts = self.api.get_page_api(prompts[-1].id, self.PAGE_SIZE)
         input("\nPress Enter to continue...")
 
     def search_prompts(self):
@@ -88,8 +109,7 @@ class ConsoleApp:
             print("No prompts found matching your criteria.")
         else:
             print("\n--- Search Results ---")
-            for prompt in prompts:
-                self.display_prompt(prompt)
+            self.display_prompts(prompts)
         input("\nPress Enter to continue...")
 
     def edit_prompt(self):
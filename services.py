@@ -1,14 +1,15 @@
+from mysql.connector import Error
 from database import PromptDB
 from models import Prompt
-from typing import List, Optional
+from typing import List, Optional, Iterator, Tuple
 
 class PromptService:
     """
     Provides business logic for managing AI prompts.
     Interacts with the PromptDB for data persistence.
     """
-    def __init__(self):
-        self.db = PromptDB()
+    def __init__(self, use_cache: bool = False):
+        self.db = PromptDB(use_cache=use_cache)
 
     def add_prompt(self, text: str, tags: List[str], tool: str) -> Optional[int]:
         """
@@ -23,6 +24,27 @@ class PromptService:
         prompt = Prompt(text=text, tags=tags, tool=tool)
         return self.db.insert_prompt(prompt)
 
+    def add_prompts(self, prompts: List[Prompt]) -> List[int]:
+        """
+        Adds many prompts to the system in a single batched transaction.
+        Args:
+            prompts (List[Prompt]): The prompts to add. Their IDs are ignored.
+        Returns:
+            List[int]: The IDs of the new prompts, or an empty list on failure.
+        """
+        return self.db.insert_prompts(prompts)
+
+    def import_prompts(self, prompts: List[Prompt]) -> bool:
+        """
+        Imports prompts with known IDs, creating missing ones and overwriting existing ones.
+        Safe to repeat, e.g. when restoring the same backup twice.
+        Args:
+            prompts (List[Prompt]): The prompts to import. Each must have an ID.
+        Returns:
+            bool: True if the import was successful, False otherwise.
+        """
+        return self.db.upsert_prompts(prompts)
+
     def get_prompt(self, prompt_id: int) -> Optional[Prompt]:
         """
         Retrieves a single prompt by its ID.
@@ -45,14 +67,28 @@ class PromptService:
         Returns:
             bool: True if the update was successful, False otherwise.
         """
-        prompt = self.db.get_prompt_by_id(prompt_id)
-        if prompt:
-            prompt.text = text
-            prompt.tags = tags
-            prompt.tool = tool
-            prompt.is_favorite = is_favorite
-            return self.db.update_prompt(prompt)
-        return False
+        # Every field is supplied, so no read is needed; a missing ID simply matches no rows
+        prompt = Prompt(id=prompt_id, text=text, tags=tags, tool=tool, is_favorite=is_favorite)
+        return self.db.update_prompt(prompt)
+
+    def bulk_edit(self, prompts: List[Prompt]) -> bool:
+        """
+        Updates many existing prompts in a single transaction, committing once at the end.
+        Either every prompt is updated or none are.
+        Args:
+            prompts (List[Prompt]): The prompts to save. Each must have the ID of an existing prompt.
+        Returns:
+            bool: True if every prompt was updated, False otherwise (nothing is changed).
+        """
+        try:
+            with self.db.transaction():
+                for prompt in prompts:
+                    if not self.db.update_prompt(prompt):
+                        raise LookupError(f"Prompt {prompt.id} could not be updated.")
+        except (LookupError, Error) as e:
+            print(f"Bulk edit rolled back: {e}")
+            return False
+        return True
 
     def delete_prompt(self, prompt_id: int) -> bool:
         """
@@ -72,6 +108,25 @@ class PromptService:
         """
         return self.db.get_all_prompts()
 
+    def list_page(self, after_id: int = 0, limit: int = 50) -> List[Prompt]:
+        """
+        Retrieves one page of prompts ordered by ID.
+        Args:
+            after_id (int): Only prompts with a greater ID are returned; use the last ID of the previous page.
+            limit (int): Maximum number of prompts in the page.
+        Returns:
+            List[Prompt]: The prompts in the page, empty when there are no more.
+        """
+        return self.db.list_page(after_id, limit)
+
+    def iter_all_prompts(self) -> Iterator[Prompt]:
+        """
+        Lazily retrieves all prompts currently in the system, in batches.
+        Returns:
+            Iterator[Prompt]: An iterator over all Prompt objects.
+        """
+        return self.db.iter_all_prompts()
+
     def search_and_filter_prompts(self, keyword: Optional[str] = None, is_favorite: Optional[bool] = None) -> List[Prompt]:
         """
         Searches and filters prompts based on a keyword and/or favorite status.
@@ -81,17 +136,24 @@ class PromptService:
         Returns:
             List[Prompt]: A list of prompts matching the criteria.
         """
-        prompts = []
+        # The favorite filter is applied in SQL so non-matching rows never leave the database
         if keyword:
-            prompts = self.db.search_prompts(keyword)
-        else:
-            prompts = self.db.get_all_prompts()
+            return self.db.search_prompts(keyword, is_favorite)
+        return self.db.list_prompts(is_favorite)
 
-        # Apply in-memory filtering for is_favorite if specified
-        if is_favorite is not None:
-            prompts = [p for p in prompts if p.is_favorite == is_favorite]
-
-        return prompts
+    def search_page(self, keyword: Optional[str] = None, offset: int = 0, limit: int = 50,
+                    is_favorite: Optional[bool] = None) -> Tuple[List[Prompt], int]:
+        """
+        Searches and filters prompts like search_and_filter_prompts, returning one page of results.
+        Args:
+            keyword (Optional[str]): A keyword to search for in text, tags, or tool fields.
+            offset (int): Number of matches to skip.
+            limit (int): Maximum number of prompts in the page.
+            is_favorite (Optional[bool]): True to filter for favorites, False for non-favorites, None for all.
+        Returns:
+            Tuple[List[Prompt], int]: The prompts in the page and the total number of matches.
+        """
+        return self.db.search_prompts_paged(keyword, offset, limit, is_favorite)
 
     def toggle_favorite_status(self, prompt_id: int) -> Optional[bool]:
         """
@@ -101,9 +163,4 @@ class PromptService:
         Returns:
             Optional[bool]: The new favorite status (True/False) if successful, None if prompt not found.
         """
-        prompt = self.db.get_prompt_by_id(prompt_id)
-        if prompt:
-            prompt.is_favorite = not prompt.is_favorite # Toggle the status
-            if self.db.update_prompt(prompt):
-                return prompt.is_favorite
-        return None
+        return self.db.toggle_favorite(prompt_id)